@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from enum import StrEnum
+from math import inf
 
 
 class CellState(StrEnum):
@@ -56,4 +57,6 @@ type Board = list[list[Cell]]
 class Result:
     search: list[Cell]
     path: list[Cell]
-    is_solved: bool
\ No newline at end of file
+    is_solved: bool
+    # path length is at most this factor of the optimal, inf if no guarantee
+    suboptimality_bound: float = inf
\ No newline at end of file
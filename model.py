@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import Protocol
-from math import inf, sqrt
+from typing import Protocol, Iterable
+from math import inf, sqrt, isfinite
 from dataclasses import dataclass
 
 from game_types import Cell, Board, Result, CellState
@@ -9,17 +9,19 @@ class PathFinder(Protocol):
     def find_path(self, board: Board) -> Result:
         ...
 
-def reset_board_color(board: list[list[Cell]], start: Cell):
-    for row in board:
-        for cell in row:
-            if cell.state == CellState.Visited:
-                if cell == start:
-                    cell.change_state(CellState.Start)
-                else:
-                    cell.change_state(CellState.Unvisited)
+# only the cells a search marked as visited need to be restored,
+# so there is no need to scan the whole board
+def reset_board_color(touched: Iterable[Cell]):
+    for cell in touched:
+        if cell.state == CellState.Visited:
+            cell.change_state(CellState.Unvisited)
 
 class Model:
-    def solve_board(self, board: Board, algorithm: str) -> Result:
+    # epsilon and heuristic only apply to A-Star, the returned path is
+    # guaranteed to be within (1 + epsilon) of the optimal length
+    def solve_board(self, board: Board, algorithm: str, epsilon: float = 0, heuristic: str = "Euclidean") -> Result:
+        if algorithm != "A-Star" and (epsilon != 0 or heuristic != "Euclidean"):
+            raise ValueError(f"epsilon and heuristic are only supported by A-Star, not {algorithm}")
         pathFinder: PathFinder | None = None
         match algorithm:
             case "DFS":
@@ -29,7 +31,7 @@ class Model:
             case "Dijkstra":
                 pathFinder = Dijkstra()
             case "A-Star":
-                pathFinder = Astar()
+                pathFinder = Astar(epsilon, heuristic)
             case _:
                 ...
         if pathFinder == None:
@@ -52,7 +54,7 @@ class DFS:
 
         is_solved = self._dfs(board, start, visited, path)
 
-        reset_board_color(board, start)
+        reset_board_color(visited)
 
         path.reverse()
         path.pop()
@@ -122,7 +124,7 @@ class BFS:
         path.reverse()
         path.pop()
 
-        reset_board_color(board, start)
+        reset_board_color(visited)
 
         return Result(visited, path, True)
         # else:
@@ -203,8 +205,8 @@ class Dijkstra:
 
         path.pop()
         path.reverse()
-        reset_board_color(board, start.cell)
-        return Result(visited, path, solved)
+        reset_board_color(visited)
+        return Result(visited, path, solved, suboptimality_bound=1)
 
     def _get_shortest_distance_cell(self, cell_list: list[DijkstraCell]) -> DijkstraCell:
         cell_list.sort(key=lambda cell: cell.distance)
@@ -220,6 +222,16 @@ class AstarCell:
 
 
 class Astar:
+    def __init__(self, epsilon: float = 0, heuristic: str = "Euclidean"):
+        if not isfinite(epsilon) or epsilon < 0:
+            raise ValueError(f"epsilon must be finite and not negative, got {epsilon}")
+        if heuristic not in ["Euclidean", "Manhattan"]:
+            raise ValueError(f"{heuristic} heuristic is not found")
+        # weighted A*: f = g + (1 + epsilon) * h, both heuristics are
+        # admissible on a 4-connected grid so the path is within the weight
+        self._weight = 1 + epsilon
+        self._heuristic = heuristic
+
     def find_path(self, board: Board) -> Result:
         a_dict: dict[Cell, AstarCell] = {}
         a_board: list[list[AstarCell]] = []
@@ -299,16 +311,19 @@ class Astar:
 
         path.pop()
         path.reverse()
-        reset_board_color(board, start.cell)
-        return Result(visited, path, solved)
+        reset_board_color(visited)
+        return Result(visited, path, solved, suboptimality_bound=self._weight)
 
 
 
     def _get_shortest_distance_cell(self, cell_list: list[AstarCell]) -> AstarCell:
-        cell_list.sort(key=lambda cell: cell.distance + cell.heuristic)
+        # break ties on f by the lower heuristic, i.e. the cell closer to the destination
+        cell_list.sort(key=lambda cell: (cell.distance + self._weight * cell.heuristic, cell.heuristic))
         return cell_list.pop(0)
 
     def _get_heuristic(self, location: tuple[int, int], destination: tuple[int, int]) -> float:
+        if self._heuristic == "Manhattan":
+            return abs(destination[0] - location[0]) + abs(destination[1] - location[1])
         return sqrt((destination[0] - location[0])**2 + (destination[1] - location[1])**2)
 
 
@@ -0,0 +1,138 @@
+from math import inf
+
+import pytest
+
+from game_types import Cell, CellState
+from model import Model, Astar, AstarCell, setup_neighbors
+
+
+def make_board(size: int = 12) -> list[list[Cell]]:
+    board = [[Cell(i, j) for j in range(size)] for i in range(size)]
+    board[0][0].change_state(CellState.Start)
+    board[size - 1][size - 1].change_state(CellState.Destination)
+    # two staggered walls so the search has to go around them
+    for i in range(size - 3):
+        board[i][size // 3].change_state(CellState.Wall)
+        board[size - 1 - i][2 * size // 3].change_state(CellState.Wall)
+    setup_neighbors(board)
+    return board
+
+
+# scattered walls where a weighted search settles for a longer path
+SCATTERED = [
+    "S.........",
+    "....##...#",
+    "..##.###..",
+    "##..#.#...",
+    "#.........",
+    "...##.....",
+    "...#..##.#",
+    "#.........",
+    "..........",
+    "#........D",
+]
+
+
+def make_scattered_board() -> list[list[Cell]]:
+    states = {"S": CellState.Start, "D": CellState.Destination, "#": CellState.Wall}
+    board = [[Cell(i, j) for j in range(len(row))] for i, row in enumerate(SCATTERED)]
+    for i, row in enumerate(SCATTERED):
+        for j, char in enumerate(row):
+            if char in states:
+                board[i][j].change_state(states[char])
+    setup_neighbors(board)
+    return board
+
+
+BOARDS = [make_board, make_scattered_board]
+
+
+# path excludes the start and destination cells, so add one to get the step count
+def path_length(make, algorithm: str, **kwargs) -> int:
+    result = Model().solve_board(make(), algorithm, **kwargs)
+    return len(result.path) + 1
+
+
+def expanded(make, **kwargs) -> int:
+    return len(Model().solve_board(make(), "A-Star", **kwargs).search)
+
+
+@pytest.mark.parametrize("make", BOARDS)
+@pytest.mark.parametrize("heuristic", ["Euclidean", "Manhattan"])
+def test_astar_without_epsilon_is_optimal(make, heuristic: str):
+    assert path_length(make, "A-Star", heuristic=heuristic) == path_length(make, "Dijkstra")
+
+
+@pytest.mark.parametrize("make", BOARDS)
+@pytest.mark.parametrize("heuristic", ["Euclidean", "Manhattan"])
+@pytest.mark.parametrize("epsilon", [0.5, 1, 3])
+def test_weighted_astar_is_within_bound(make, epsilon: float, heuristic: str):
+    optimal = path_length(make, "Dijkstra")
+    assert path_length(make, "A-Star", epsilon=epsilon, heuristic=heuristic) <= (1 + epsilon) * optimal
+
+
+def test_weighted_astar_can_return_longer_path():
+    optimal = path_length(make_scattered_board, "Dijkstra")
+    weighted = path_length(make_scattered_board, "A-Star", epsilon=1, heuristic="Manhattan")
+    assert optimal < weighted <= 2 * optimal
+
+
+@pytest.mark.parametrize("make", BOARDS)
+def test_larger_epsilon_expands_fewer_cells(make):
+    counts = [expanded(make, epsilon=epsilon) for epsilon in [0, 0.5, 3]]
+    assert counts[0] > counts[1] > counts[2]
+
+
+@pytest.mark.parametrize("epsilon", [0, 0.5, 1, 3])
+def test_manhattan_expands_fewer_cells_than_euclidean(epsilon: float):
+    manhattan = expanded(make_scattered_board, epsilon=epsilon, heuristic="Manhattan")
+    assert manhattan < expanded(make_scattered_board, epsilon=epsilon)
+
+
+def test_ties_on_f_prefer_lower_heuristic():
+    far = AstarCell(Cell(0, 0), 2, 4, None)
+    near = AstarCell(Cell(0, 1), 4, 2, None)
+    to_visit = [far, near]
+    assert Astar()._get_shortest_distance_cell(to_visit) is near
+    assert to_visit == [far]
+
+
+@pytest.mark.parametrize("algorithm, kwargs, bound", [
+    ("DFS", {}, inf),
+    ("BFS", {}, inf),
+    ("Dijkstra", {}, 1),
+    ("A-Star", {}, 1),
+    ("A-Star", {"epsilon": 0.5}, 1.5),
+])
+def test_suboptimality_bound(algorithm: str, kwargs: dict, bound: float):
+    assert Model().solve_board(make_board(), algorithm, **kwargs).suboptimality_bound == bound
+
+
+@pytest.mark.parametrize("algorithm", ["DFS", "BFS", "Dijkstra", "A-Star"])
+def test_solve_only_resets_touched_cells(algorithm: str):
+    board = make_board()
+    # wall off a corner the search cannot reach and leave it marked as visited
+    board[0][10].change_state(CellState.Wall)
+    board[1][11].change_state(CellState.Wall)
+    board[0][11].change_state(CellState.Visited)
+    result = Model().solve_board(board, algorithm)
+    assert all(cell.state == CellState.Unvisited for cell in result.search)
+    assert board[0][0].state == CellState.Start
+    assert board[0][11].state == CellState.Visited
+
+
+@pytest.mark.parametrize("epsilon", [-1, inf, float("nan")])
+def test_astar_rejects_invalid_epsilon(epsilon: float):
+    with pytest.raises(ValueError):
+        Model().solve_board(make_board(), "A-Star", epsilon)
+
+
+def test_astar_rejects_unknown_heuristic():
+    with pytest.raises(ValueError):
+        Model().solve_board(make_board(), "A-Star", heuristic="Chebyshev")
+
+
+@pytest.mark.parametrize("kwargs", [{"epsilon": 1}, {"heuristic": "Manhattan"}])
+def test_other_algorithms_reject_astar_options(kwargs: dict):
+    with pytest.raises(ValueError):
+        Model().solve_board(make_board(), "Dijkstra", **kwargs)
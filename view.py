@@ -61,6 +61,9 @@ class Board:
         self._row = row
         self._col = col
         self.board = self._create_blank_board()
+        self.cells = [[view_cell.cell for view_cell in row] for row in self.board]
+        # cells changed by an animation, so a reset only has to revisit these
+        self.touched: set[Cell] = set()
         self.board_rect = self._get_board_dimensions()
         self._setup_neighbors()
 
@@ -174,6 +177,7 @@ class View:
                 self._prev_cell.change_state(CellState.Visited)
             curr_cell = self.result.search.pop(0)
             curr_cell.change_state(CellState.currLocation)
+            self.board.touched.add(curr_cell)
             self._prev_cell = curr_cell
             if len(self.result.search) == 0:
                 curr_cell.change_state(CellState.Visited)
@@ -181,14 +185,15 @@ class View:
         elif len(self.result.path) != 0:
             curr_cell = self.result.path.pop(0)
             curr_cell.change_state(CellState.Path)
+            self.board.touched.add(curr_cell)
             return False
         return True
 
-    def _reset_board(self, board: list[list[Cell]]):
-        for row in board:
-            for cell in row:
-                if cell.state not in [CellState.Start, CellState.Destination, CellState.Wall]:
-                    cell.change_state(CellState.Unvisited)
+    def _reset_board(self):
+        for cell in self.board.touched:
+            if cell.state not in [CellState.Start, CellState.Destination, CellState.Wall]:
+                cell.change_state(CellState.Unvisited)
+        self.board.touched.clear()
 
     def run(self):
         running = True
@@ -240,8 +245,8 @@ class View:
 
                     if self._start.rect.collidepoint(mouse_pos) and self._has_dest and self._has_start and not self._solved and self._algorithm != "":  
                         print("VISUALIZE")
-                        self._reset_board([[cell.cell for cell in row] for row in self.board.board])
-                        self.result = self.solver.solve_board([[cell.cell for cell in row] for row in self.board.board], self._algorithm)
+                        self._reset_board()
+                        self.result = self.solver.solve_board(self.board.cells, self._algorithm)
                         if self.result.is_solved:
                             # start visualization
                             self._visualizing = True
@@ -256,6 +261,7 @@ class View:
                         for row in self.board.board:
                             for cell in row:
                                 cell.cell.change_state(CellState.Unvisited)
+                        self.board.touched.clear()
 
                     for btn in [self._dfs, self._bfs, self._dijkstra, self._astar]:
                         if btn.rect.collidepoint(mouse_pos):